@@ -5,12 +5,25 @@ from tkinter import filedialog, Text, Scrollbar, ttk
 import threading
 import requests
 from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import urllib.parse
 import html
 import json
 import sys
 import time
 import pickle
+import sqlite3
+import zlib
+import heapq
+import itertools
+import base64
+import mmap
+import struct
+import hashlib
+import argparse
+import multiprocessing
+from array import array
+from math import gcd
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -26,6 +39,11 @@ API_URL = "https://db.ygoprodeck.com/api/v7/cardinfo.php"
 KONAMI_DB_BASE = "https://www.db.yugioh-card.com"
 KONAMI_DB_SEARCH_URL = KONAMI_DB_BASE + "/yugiohdb/card_search.action?ope=1&sess=1&rp=10&mode=&sort=1&keyword={}"
 MAX_WORKERS = 20
+PER_HOST_CONCURRENCY = 4
+MIN_MAIN_DECK_SIZE = 40
+CUT_SUGGESTION_COUNT = 3
+BATCH_PROGRESS_INTERVAL = 1.0
+YDKE_PREFIX = "ydke://"
 GITHUB_API_URL = "https://api.github.com/repos/cfnnit/ydk-genisis-counter/contents/point%20rule"
 
 GITHUB_HEADERS = {
@@ -33,52 +51,393 @@ GITHUB_HEADERS = {
     'User-Agent': 'YDK-Point-Calculator'
 }
 
+COMPILED_TABLE_MAGIC = b'YGPT'
+COMPILED_TABLE_VERSION = 1
+COMPILED_TABLE_SUFFIX = '.bin'
+IDENTITY_TABLE_FILENAME = 'card_identity.bin'
+# magic, version, 원본 mtime_ns, 원본 크기, 항목 수, 이름 테이블 위치
+COMPILED_TABLE_HEADER = struct.Struct('<4sIqqII')
+# 키, 값, 이름 위치
+COMPILED_TABLE_ENTRY = struct.Struct('<QiI')
+COMPILED_TABLE_NAME_LENGTH = struct.Struct('<H')
+
+HTTP_CACHE_FILENAME = 'http_cache.sqlite3'
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 KONAMI_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
 
-korean_name_cache = {}
-card_data_cache = {}
+CACHE_STALE_SECONDS = 7 * 24 * 60 * 60
+REVALIDATION_WORKERS = 2
+CARD_CACHE_SHARDS = 16
+CARD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CARD_CACHE_VERSION = 2
+DECK_RESULT_CACHE_SIZE = 2000
+RESULT_REFRESH_DELAY_MS = 500
+SEARCH_DEBOUNCE_MS = 150
+DECK_SORT_OPTIONS = ("이름순", "수정순", "포인트순")
+WARMER_SELECTED_PRIORITY = 0
+WARMER_FOLDER_PRIORITY = 1
+WARMER_REQUEST_INTERVAL = 0.2
+WARMER_MAX_BACKOFF = 60.0
+
+# 카드 캐시 키 종류. 키는 (종류, 식별자...) 튜플로 저장한다
+KEY_CID_ENGLISH = 'cid_en'
+KEY_PASSCODE_ENGLISH = 'passcode_en'
+KEY_PASSCODE_KOREAN = 'passcode_ko'
+KEY_KONAMI_KOREAN = 'konami_ko'
+KEY_CID_RESULT = 'cid_result'
+KEY_PASSCODE_RESULT = 'passcode_result'
+SCORE_KEY_KINDS = (KEY_CID_RESULT, KEY_PASSCODE_RESULT)
+
+class CacheEntry:
+    __slots__ = ('value', 'fetched_at', 'size')
+
+    def __init__(self, value, fetched_at, size):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.size = size
+
+def estimate_size(obj):
+    if isinstance(obj, tuple):
+        return sys.getsizeof(obj) + sum(estimate_size(item) for item in obj)
+    return sys.getsizeof(obj)
+
+class ShardedCache:
+    def __init__(self, shard_count=CARD_CACHE_SHARDS, max_bytes=CARD_CACHE_MAX_BYTES):
+        self.shards = [OrderedDict() for _ in range(shard_count)]
+        self.locks = [threading.Lock() for _ in range(shard_count)]
+        self.sizes = [0] * shard_count
+        self.max_shard_bytes = max_bytes // shard_count
+
+    def shard_index(self, key):
+        return hash(key) % len(self.shards)
+
+    def lookup(self, key):
+        index = self.shard_index(key)
+        with self.locks[index]:
+            entry = self.shards[index].get(key)
+            if entry is None:
+                return False, None, False
+            self.shards[index].move_to_end(key)
+            return True, entry.value, time.time() - entry.fetched_at > CACHE_STALE_SECONDS
+
+    def store(self, key, value, fetched_at=None):
+        index = self.shard_index(key)
+        entry = CacheEntry(value, time.time() if fetched_at is None else fetched_at, 0)
+        entry.size = sys.getsizeof(entry) + estimate_size(key) + estimate_size(value)
+
+        with self.locks[index]:
+            shard = self.shards[index]
+            previous = shard.pop(key, None)
+            if previous is not None:
+                self.sizes[index] -= previous.size
+            shard[key] = entry
+            self.sizes[index] += entry.size
+
+            while self.sizes[index] > self.max_shard_bytes and len(shard) > 1:
+                _, evicted = shard.popitem(last=False)
+                self.sizes[index] -= evicted.size
+
+    def discard_kinds(self, kinds):
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                for key in [key for key in shard if key[0] in kinds]:
+                    self.sizes[index] -= shard.pop(key).size
+
+    def clear(self):
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                shard.clear()
+                self.sizes[index] = 0
+
+    def snapshot(self, kinds=None):
+        # 샤드 단위로 잠그고 복사하므로 저장 중에도 다른 샤드는 계속 사용할 수 있다
+        items = []
+        for index, shard in enumerate(self.shards):
+            with self.locks[index]:
+                items.extend(
+                    (key, entry.value, entry.fetched_at) for key, entry in shard.items()
+                    if kinds is None or key[0] in kinds
+                )
+        return items
+
+    def restore(self, items):
+        for key, value, fetched_at in items:
+            self.store(key, value, fetched_at)
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards)
+
+card_cache = ShardedCache()
+
+def deck_result_key(deck, options):
+    # 카드 순서와 무관하도록 구역별로 정렬한 패스코드로 해시를 만든다
+    deck_hash = hashlib.blake2b(digest_size=16)
+    for section in ('main', 'extra', 'side'):
+        deck_hash.update(f"{section}:{','.join(sorted(str(passcode) for passcode in deck[section]))};".encode('ascii'))
+    return (
+        deck_hash.hexdigest(), options['rule_version'],
+        options['show_zero_points'], options['scrape_yugipedia'], options['include_side_deck']
+    )
+
+class DeckResultCache:
+    def __init__(self, max_entries=DECK_RESULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.results = OrderedDict()
+        self.file_totals = {}
+
+    def get(self, key):
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.results.move_to_end(key)
+            return result
+
+    def store(self, key, result):
+        with self.lock:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.max_entries:
+                self.results.popitem(last=False)
+
+    def record_file_total(self, ydk_file, rule_version, total):
+        try:
+            mtime = os.path.getmtime(ydk_file)
+        except OSError:
+            return
+        with self.lock:
+            self.file_totals[os.path.abspath(ydk_file)] = (mtime, rule_version, total)
+
+    def file_total(self, ydk_file, rule_version, current_mtime=None):
+        with self.lock:
+            record = self.file_totals.get(os.path.abspath(ydk_file))
+        if record is None:
+            return None
+        mtime, recorded_rule_version, total = record
+        try:
+            if current_mtime is None:
+                current_mtime = os.path.getmtime(ydk_file)
+        except OSError:
+            return None
+        if recorded_rule_version != rule_version or current_mtime != mtime:
+            return None
+        return total
+
+    def clear(self):
+        # 카드 정보가 바뀌면 이전 결과는 모두 무효가 된다
+        with self.lock:
+            self.results.clear()
+            self.file_totals.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return {'results': list(self.results.items()), 'file_totals': dict(self.file_totals)}
+
+    def restore(self, data):
+        with self.lock:
+            self.results.update(data.get('results', []))
+            self.file_totals.update(data.get('file_totals', {}))
+
+deck_result_cache = DeckResultCache()
+
+revalidation_executor = ThreadPoolExecutor(max_workers=REVALIDATION_WORKERS)
+pending_revalidations = set()
+pending_revalidations_lock = threading.Lock()
+cache_change_listeners = []
+
+def schedule_revalidation(key, refetch):
+    with pending_revalidations_lock:
+        if key in pending_revalidations:
+            return
+        pending_revalidations.add(key)
+
+    old_value = card_cache.lookup(key)[1]
+
+    def revalidate():
+        try:
+            refetch()
+            if card_cache.lookup(key)[1] != old_value:
+                deck_result_cache.clear()
+                for listener in cache_change_listeners:
+                    listener()
+        except Exception as e:
+            print(f"캐시 갱신 오류 ({key}): {e}")
+        finally:
+            with pending_revalidations_lock:
+                pending_revalidations.discard(key)
+
+    revalidation_executor.submit(revalidate)
+
+def cached_lookup(key, refetch, offline):
+    found, value, stale = card_cache.lookup(key)
+    if found and stale and not offline:
+        schedule_revalidation(key, refetch)
+    return found, value
+
+def legacy_cache_items(cache_data):
+    # 이전 버전 cache.pkl 의 문자열 키를 종류별 키로 옮긴다
+    items = []
+    for key, entry in cache_data.get('korean_name_cache', {}).items():
+        value, fetched_at = entry if isinstance(entry, tuple) else (entry, 0)
+        if key.startswith('cid_'):
+            items.append(((KEY_CID_ENGLISH, key[len('cid_'):]), value, fetched_at))
+        elif key.startswith('pass_'):
+            items.append(((KEY_PASSCODE_KOREAN, key[len('pass_'):]), value, fetched_at))
+        else:
+            items.append(((KEY_KONAMI_KOREAN, key), value, fetched_at))
+    for passcode, entry in cache_data.get('card_identity_cache', {}).items():
+        value, fetched_at = entry if isinstance(entry, tuple) else (entry, 0)
+        items.append(((KEY_PASSCODE_ENGLISH, passcode), value, fetched_at))
+    return items
 
 def save_caches(app_instance=None):
     if app_instance and not app_instance.save_cache.get():
         return
-        
+
+    cache_path = resource_path('cache.pkl')
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
         cache_data = {
-            'korean_name_cache': korean_name_cache,
-            'card_data_cache': card_data_cache
+            'version': CARD_CACHE_VERSION,
+            'card_cache': card_cache.snapshot(),
+            'deck_results': deck_result_cache.snapshot()
         }
-        with open(resource_path('cache.pkl'), 'wb') as f:
+        with open(temp_path, 'wb') as f:
             pickle.dump(cache_data, f)
+        os.replace(temp_path, cache_path)
     except Exception as e:
         print(f"캐시 저장 오류: {e}")
 
 def load_caches():
-    global korean_name_cache, card_data_cache
     try:
         with open(resource_path('cache.pkl'), 'rb') as f:
             cache_data = pickle.load(f)
-            korean_name_cache = cache_data.get('korean_name_cache', {})
-            card_data_cache = cache_data.get('card_data_cache', {})
+        if cache_data.get('version') == CARD_CACHE_VERSION:
+            card_cache.restore(cache_data.get('card_cache', []))
+            deck_result_cache.restore(cache_data.get('deck_results', {}))
+        else:
+            card_cache.restore(legacy_cache_items(cache_data))
     except FileNotFoundError:
         pass
     except Exception as e:
         print(f"캐시 로드 오류: {e}")
 
-def clear_caches():
-    korean_name_cache.clear()
-    card_data_cache.clear()
-    try:
-        if os.path.exists(resource_path('cache.pkl')):
-            os.remove(resource_path('cache.pkl'))
-    except Exception:
-        pass
-    print("캐시가 초기화되었습니다.")
+def clear_score_cache():
+    # 카드 이름은 룰과 무관하므로 점수가 담긴 캐시만 비운다
+    card_cache.discard_kinds(SCORE_KEY_KINDS)
+
+class HttpCache:
+    def __init__(self, cache_path, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(cache_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, status INTEGER, encoding TEXT, etag TEXT, last_modified TEXT, "
+            "body BLOB, size INTEGER, last_used REAL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self.connection.commit()
+        self.total_size = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def lookup(self, url):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT status, encoding, etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None:
+                self.connection.execute("UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url))
+                self.connection.commit()
+        return row
+
+    def store(self, url, response):
+        body = zlib.compress(response.content)
+        with self.lock:
+            previous = self.connection.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if previous is not None:
+                self.total_size -= previous[0]
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (url, status, encoding, etag, last_modified, body, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, response.encoding, response.headers.get('ETag'),
+                 response.headers.get('Last-Modified'), body, len(body), time.time())
+            )
+            self.total_size += len(body)
+            self.evict()
+            self.connection.commit()
+
+    def evict(self):
+        while self.total_size > self.max_bytes:
+            oldest = self.connection.execute("SELECT url, size FROM responses ORDER BY last_used LIMIT 1").fetchone()
+            if oldest is None:
+                break
+            self.connection.execute("DELETE FROM responses WHERE url = ?", (oldest[0],))
+            self.total_size -= oldest[1]
+
+    def build_response(self, url, row):
+        status, encoding, _, _, body = row
+        response = requests.models.Response()
+        response.url = url
+        response.status_code = status
+        response.encoding = encoding
+        response._content = zlib.decompress(body)
+        return response
+
+    def get(self, url, params=None, headers=None, timeout=10, offline=False):
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        row = self.lookup(full_url)
+        if offline:
+            if row is None:
+                raise requests.exceptions.ConnectionError(f"오프라인 모드: 저장된 응답이 없습니다 ({full_url})")
+            return self.build_response(full_url, row)
+
+        request_headers = dict(headers or {})
+        if row is not None:
+            _, _, etag, last_modified, _ = row
+            if etag:
+                request_headers['If-None-Match'] = etag
+            if last_modified:
+                request_headers['If-Modified-Since'] = last_modified
+
+        try:
+            response = requests.get(full_url, headers=request_headers, timeout=timeout)
+        except requests.exceptions.RequestException:
+            # 네트워크 장애시 저장된 응답으로 대신한다
+            if row is None:
+                raise
+            return self.build_response(full_url, row)
+
+        if response.status_code == 304 and row is not None:
+            return self.build_response(full_url, row)
+        if response.status_code == 200:
+            self.store(full_url, response)
+        return response
+
+http_cache = None
+http_cache_lock = threading.Lock()
+
+def http_get(url, params=None, headers=None, timeout=10, offline=False):
+    global http_cache
+    with http_cache_lock:
+        if http_cache is None:
+            try:
+                http_cache = HttpCache(resource_path(HTTP_CACHE_FILENAME))
+            except sqlite3.Error as e:
+                print(f"HTTP 캐시를 열 수 없습니다: {e}")
+                http_cache = False
+
+    if not http_cache:
+        if offline:
+            raise requests.exceptions.ConnectionError("오프라인 모드에서는 요청할 수 없습니다.")
+        return requests.get(url, params=params, headers=headers, timeout=timeout)
+    return http_cache.get(url, params=params, headers=headers, timeout=timeout, offline=offline)
 
 def get_points_files_from_github():
     try:
-        response = requests.get(GITHUB_API_URL, headers=GITHUB_HEADERS, timeout=10)
+        response = http_get(GITHUB_API_URL, headers=GITHUB_HEADERS, timeout=10)
         response.raise_for_status()
         
         files = response.json()
@@ -105,41 +464,69 @@ def get_points_files_from_github():
         print(f"포인트 파일 목록 가져오기 오류: {e}")
         return []
 
+def get_local_points_files():
+    points_files = []
+    try:
+        for filename in os.listdir(resource_path("")):
+            date_match = re.search(r'^(\d+)\.txt$', filename)
+            if date_match:
+                points_files.append({
+                    'filename': filename,
+                    'date': date_match.group(1),
+                    'download_url': None
+                })
+    except OSError as e:
+        print(f"저장된 포인트 파일 목록 읽기 오류: {e}")
+
+    points_files.sort(key=lambda x: x['date'], reverse=True)
+    return points_files
+
 def download_points_file(download_url, filename):
     try:
         headers = GITHUB_HEADERS.copy()
         headers['Accept'] = 'application/vnd.github.v3.raw'
         
-        response = requests.get(download_url, headers=headers, timeout=15)
+        response = http_get(download_url, headers=headers, timeout=15)
         response.raise_for_status()
         
         file_path = resource_path(filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(response.text)
+        # 줄바꿈 변환 없이 바이트 단위로 비교해야 CRLF 룰 파일도 매번 다시 쓰지 않는다
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read() == response.content:
+                    return True
+        except FileNotFoundError:
+            pass
+
+        with open(file_path, 'wb') as f:
+            f.write(response.content)
         
         return True
     except Exception as e:
         print(f"포인트 파일 다운로드 오류: {e}")
         return False
 
-def get_korean_name_from_konami(english_name):
-    if english_name in korean_name_cache:
-        return korean_name_cache[english_name]
-    
+def get_korean_name_from_konami(english_name, offline=False, refresh=False):
+    cache_key = (KEY_KONAMI_KOREAN, english_name)
+    if not refresh:
+        found, value = cached_lookup(cache_key, lambda: get_korean_name_from_konami(english_name, refresh=True), offline)
+        if found:
+            return value
+
     try:
         keyword = urllib.parse.quote_plus(english_name)
         search_url = KONAMI_DB_SEARCH_URL.format(keyword)
-        
-        search_resp = requests.get(search_url, headers=KONAMI_HEADERS, timeout=10)
+
+        search_resp = http_get(search_url, headers=KONAMI_HEADERS, timeout=10, offline=offline)
         search_resp.raise_for_status()
-        
+
         pair_pattern = re.compile(
             r'class="cnm"\s+value=[\'\"]([^\'\"]+)[\'\"][\s\S]*?class="link_value"\s+value=[\'\"]([^\'\"]+)[\'\"]',
             re.DOTALL
         )
         candidates = pair_pattern.findall(search_resp.text)
         if not candidates:
-            korean_name_cache[english_name] = None
+            card_cache.store(cache_key, None)
             return None
 
         selected_relative = None
@@ -152,54 +539,55 @@ def get_korean_name_from_konami(english_name):
             selected_relative = candidates[0][1]
 
         detail_url = KONAMI_DB_BASE + selected_relative + "&request_locale=ko"
-        detail_resp = requests.get(detail_url, headers=KONAMI_HEADERS, timeout=10)
+        detail_resp = http_get(detail_url, headers=KONAMI_HEADERS, timeout=10, offline=offline)
         detail_resp.raise_for_status()
 
         title_match = re.search(r'<title>([^<]+)</title>', detail_resp.text, re.IGNORECASE)
         if not title_match:
-            korean_name_cache[english_name] = None
+            card_cache.store(cache_key, None)
             return None
-            
+
         title_text = title_match.group(1).strip()
         korean_name = title_text.split('|')[0].strip()
         result = korean_name if korean_name else None
-        korean_name_cache[english_name] = result
+        card_cache.store(cache_key, result)
         return result
-        
+
     except requests.exceptions.RequestException:
-        korean_name_cache[english_name] = None
-        return None
+        # 네트워크 오류는 기존 캐시 값을 덮어쓰지 않는다
+        return card_cache.lookup(cache_key)[1]
     except Exception:
-        korean_name_cache[english_name] = None
+        card_cache.store(cache_key, None)
         return None
 
-def get_english_name_from_cid(cid):
-    cache_key = f"cid_{cid}"
-    if cache_key in korean_name_cache:
-        return korean_name_cache[cache_key]
-    
+def get_english_name_from_cid(cid, offline=False, refresh=False):
+    cache_key = (KEY_CID_ENGLISH, str(cid))
+    if not refresh:
+        found, value = cached_lookup(cache_key, lambda: get_english_name_from_cid(cid, refresh=True), offline)
+        if found:
+            return value
+
     try:
         detail_url = f"{KONAMI_DB_BASE}/yugiohdb/card_search.action?ope=2&cid={cid}&request_locale=en"
-        detail_resp = requests.get(detail_url, headers=KONAMI_HEADERS, timeout=5)
+        detail_resp = http_get(detail_url, headers=KONAMI_HEADERS, timeout=5, offline=offline)
         detail_resp.raise_for_status()
 
         title_pattern = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
         title_match = title_pattern.search(detail_resp.text)
         if not title_match:
-            korean_name_cache[cache_key] = None
+            card_cache.store(cache_key, None)
             return None
-            
+
         title_text = title_match.group(1).strip()
         english_name = title_text.split('|')[0].strip()
         result = english_name if english_name else None
-        korean_name_cache[cache_key] = result
+        card_cache.store(cache_key, result)
         return result
-        
+
     except requests.exceptions.RequestException:
-        korean_name_cache[cache_key] = None
-        return None
+        return card_cache.lookup(cache_key)[1]
     except Exception:
-        korean_name_cache[cache_key] = None
+        card_cache.store(cache_key, None)
         return None
 
 def extract_cards_from_html(html_content):
@@ -245,82 +633,111 @@ def extract_cards_from_html(html_content):
     return cards
 
 def fetch_card_data_from_cid(cid, points, options, app_instance):
-    cache_key = f"cid_{cid}_{options['scrape_yugipedia']}_{options['show_zero_points']}"
-    if cache_key in card_data_cache:
-        return card_data_cache[cache_key]
-    
+    cache_key = (KEY_CID_RESULT, str(cid), options['scrape_yugipedia'], options['show_zero_points'])
+    found, cached_result, _ = card_cache.lookup(cache_key)
+    if found:
+        return cached_result
+
+    offline = options.get('offline_mode', False)
     card_name_ko = f"알 수 없는 카드 (cid:{cid})"
     card_name_en = None
     score = 0
 
     try:
-        english_cache_key = f"cid_{cid}"
-        if english_cache_key in korean_name_cache:
-            card_name_en = korean_name_cache[english_cache_key]
-        else:
-            card_name_en = get_english_name_from_cid(cid)
-            
+        card_name_en = get_english_name_from_cid(cid, offline)
+
         if not card_name_en:
-            result = (card_name_ko, 0) if options['show_zero_points'] else None
-            card_data_cache[cache_key] = result
-            return result
-            
+            # 오프라인이거나 네트워크 오류일 수 있으므로 저장하지 않고 다음에 다시 조회한다
+            return (card_name_ko, 0) if options['show_zero_points'] else None
+
         card_name_ko = card_name_en
-        
+
         if options['scrape_yugipedia'] and card_name_en:
-            if card_name_en in korean_name_cache:
-                korean_name = korean_name_cache[card_name_en]
-                if korean_name:
-                    card_name_ko = korean_name
-            else:
-                scraped_name = get_korean_name_from_konami(card_name_en)
-                if scraped_name:
-                    card_name_ko = scraped_name
+            scraped_name = get_korean_name_from_konami(card_name_en, offline)
+            if scraped_name:
+                card_name_ko = scraped_name
 
         score = points.get(card_name_en, 0)
 
     except Exception as e:
         print(f"cid {cid} 처리 중 오류: {e}")
-    
+
     result = (card_name_ko, score) if (options['show_zero_points'] or score > 0) else None
-    card_data_cache[cache_key] = result
+    if card_name_en:
+        card_cache.store(cache_key, result)
     return result
 
+def get_english_name_from_passcode(passcode, offline=False, refresh=False):
+    passcode = str(passcode)
+    cache_key = (KEY_PASSCODE_ENGLISH, passcode)
+    if not refresh:
+        found, value = cached_lookup(cache_key, lambda: get_english_name_from_passcode(passcode, refresh=True), offline)
+        if found:
+            return value
+
+    try:
+        response_en = http_get(API_URL, params={'id': passcode}, timeout=5, offline=offline)
+        # 없는 패스코드(비공식, 미발매 카드 등)에는 400 을 돌려주므로 없는 카드로 저장한다
+        if response_en.status_code in (400, 404):
+            card_cache.store(cache_key, None)
+            return None
+        response_en.raise_for_status()
+        card_name_en = response_en.json()['data'][0].get('name')
+    except requests.exceptions.RequestException:
+        return card_cache.lookup(cache_key)[1]
+    except (IndexError, KeyError, ValueError):
+        card_name_en = None
+
+    card_cache.store(cache_key, card_name_en)
+    return card_name_en
+
+def get_korean_name_from_passcode(passcode, offline=False, refresh=False):
+    cache_key = (KEY_PASSCODE_KOREAN, str(passcode))
+    if not refresh:
+        found, value = cached_lookup(cache_key, lambda: get_korean_name_from_passcode(passcode, refresh=True), offline)
+        if found:
+            return value
+
+    try:
+        response_ko = http_get(API_URL, params={'language': 'ko', 'id': passcode}, timeout=5, offline=offline)
+        if response_ko.status_code != 200:
+            card_cache.store(cache_key, None)
+            return None
+        korean_name = response_ko.json()['data'][0].get('name')
+    except requests.exceptions.RequestException:
+        return card_cache.lookup(cache_key)[1]
+    except (IndexError, KeyError, ValueError):
+        korean_name = None
+
+    card_cache.store(cache_key, korean_name)
+    return korean_name
+
 def fetch_card_data(passcode, points, options, app_instance):
-    cache_key = f"{passcode}_{options['scrape_yugipedia']}_{options['show_zero_points']}"
-    if cache_key in card_data_cache:
-        return card_data_cache[cache_key]
-    
+    cache_key = (KEY_PASSCODE_RESULT, str(passcode), options['scrape_yugipedia'], options['show_zero_points'])
+    found, cached_result, _ = card_cache.lookup(cache_key)
+    if found:
+        return cached_result
+
+    offline = options.get('offline_mode', False)
     card_name_ko = f"알 수 없는 카드 (password:{passcode})"
-    card_name_en = None
     score = 0
 
-    try:
-        response_en = requests.get(API_URL, params={'id': passcode}, timeout=5)
-        response_en.raise_for_status()
-        card_data = response_en.json()['data'][0]
-        card_name_en = card_data.get('name')
-        card_name_ko = card_name_en
-        
-        response_ko = requests.get(API_URL, params={'language': 'ko', 'id': passcode}, timeout=5)
-        if response_ko.status_code == 200:
-            card_data_ko = response_ko.json()['data'][0]
-            card_name_ko = card_data_ko.get('name', card_name_en)
-        
+    card_name_en = get_english_name_from_passcode(passcode, offline)
+    if card_name_en:
+        card_name_ko = get_korean_name_from_passcode(passcode, offline) or card_name_en
+
         if card_name_ko == card_name_en and options['scrape_yugipedia']:
             app_instance.root.after(0, lambda: app_instance.status_label.config(text=f"KONAMI DB 검색 중: {card_name_en}"))
-            scraped_name = get_korean_name_from_konami(card_name_en)
+            scraped_name = get_korean_name_from_konami(card_name_en, offline)
             if scraped_name:
                 card_name_ko = scraped_name
 
-    except (requests.exceptions.RequestException, IndexError, KeyError):
-        pass 
-
-    if card_name_en:
         score = points.get(card_name_en, 0)
-    
+
     result = (card_name_ko, score) if (options['show_zero_points'] or score > 0) else None
-    card_data_cache[cache_key] = result
+    if card_name_en:
+        # 이름을 못 찾은 카드는 오프라인 해제나 네트워크 복구 후 다시 조회해야 하므로 저장하지 않는다
+        card_cache.store(cache_key, result)
     return result
 
 def calculate_url_score(url, points, result_text_widget, app_instance, options):
@@ -332,7 +749,7 @@ def calculate_url_score(url, points, result_text_widget, app_instance, options):
         result_text_widget.delete(1.0, tk.END)
         
         app_instance.root.after(0, lambda: app_instance.status_label.config(text="URL에서 덱 정보 다운로드 중..."))
-        response = requests.get(url, headers=KONAMI_HEADERS, timeout=10)
+        response = http_get(url, headers=KONAMI_HEADERS, timeout=10, offline=options.get('offline_mode', False))
         response.raise_for_status()
         html_content = response.text
         
@@ -426,6 +843,15 @@ def calculate_url_score(url, points, result_text_widget, app_instance, options):
         grand_total_score = main_and_extra_total + side_deck_total_score
         result_text_widget.insert(tk.END, f"\n--- 전체 포인트: {grand_total_score} ---\n")
 
+        scored_cids = cards['main'] + cards['extra'] + (cards['side'] if options['include_side_deck'] else [])
+        unresolved_cids = [cid for cid in scored_cids if not card_cache.lookup((KEY_CID_ENGLISH, str(cid)))[1]]
+        if unresolved_cids:
+            result_text_widget.insert(tk.END, f"경고: 확인할 수 없는 카드 {len(unresolved_cids)}장은 포인트에 포함되지 않았습니다. (cid: {', '.join(unresolved_cids)})\n")
+
+        if options.get('point_budget') is not None:
+            # 뉴런 페이지에서는 카드 종류만 추출되고 매수는 알 수 없으므로 컷 제안을 하지 않는다
+            result_text_widget.insert(tk.END, "\n뉴런 URL 덱은 카드 매수를 알 수 없어 컷 제안을 지원하지 않습니다.\n")
+
     except Exception as e:
         result_text_widget.insert(tk.END, f"오류 발생: {e}\n")
     finally:
@@ -434,7 +860,7 @@ def calculate_url_score(url, points, result_text_widget, app_instance, options):
         app_instance.root.after(0, lambda: app_instance.calculate_url_btn.config(state=tk.NORMAL))
         app_instance.root.after(0, lambda: app_instance.status_label.config(text="준비 완료."))
 
-def aggregate_cards(cards_list):
+def count_cards(cards_list):
     card_count = {}
     for name, score in cards_list:
         if name in card_count:
@@ -442,6 +868,120 @@ def aggregate_cards(cards_list):
             card_count[name]['total_score'] += score
         else:
             card_count[name] = {'count': 1, 'total_score': score, 'unit_score': score}
+    return card_count
+
+host_semaphores = {}
+host_semaphores_lock = threading.Lock()
+
+def get_host_semaphore(url):
+    host = urllib.parse.urlsplit(url).netloc
+    with host_semaphores_lock:
+        if host not in host_semaphores:
+            host_semaphores[host] = threading.Semaphore(PER_HOST_CONCURRENCY)
+        return host_semaphores[host]
+
+def download_deck_page(url, offline):
+    with get_host_semaphore(url):
+        response = http_get(url, headers=KONAMI_HEADERS, timeout=10, offline=offline)
+    response.raise_for_status()
+    return response.text
+
+def extract_deck_title(html_content, url):
+    title_match = re.search(r'<title>([^<]+)</title>', html_content, re.IGNORECASE)
+    if not title_match:
+        return url
+    title = html.unescape(title_match.group(1)).split('|')[0].strip()
+    return title or url
+
+def score_neuron_urls(urls, points, options, report_status=None):
+    offline = options.get('offline_mode', False)
+    report_status = report_status or (lambda text: None)
+    sections = ('main', 'extra', 'side') if options['include_side_deck'] else ('main', 'extra')
+
+    report_status(f"덱 페이지 다운로드 중... ({len(urls)}개)")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(download_deck_page, url, offline) for url in urls]
+
+    decks = []
+    all_cids = set()
+    for url, future in zip(urls, futures):
+        deck = {'url': url, 'title': url, 'main_score': 0, 'side_score': 0, 'missing': [], 'error': None}
+        try:
+            html_content = future.result()
+        except Exception as e:
+            deck['error'] = str(e)
+            decks.append(deck)
+            continue
+
+        deck['title'] = extract_deck_title(html_content, url)
+        deck['cards'] = extract_cards_from_html(html_content)
+        if not any(deck['cards'].values()):
+            deck['error'] = "카드 정보를 찾을 수 없습니다."
+        for section in sections:
+            all_cids.update(deck['cards'][section])
+        decks.append(deck)
+
+    report_status(f"카드 정보 가져오는 중... ({len(all_cids)}종)")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        cid_list = list(all_cids)
+        card_results = dict(zip(cid_list, executor.map(lambda cid: fetch_card_data_from_cid(cid, points, options, None), cid_list)))
+    # 실패한 조회는 저장되지 않으므로 덱마다 다시 요청하지 않도록 여기서 한 번만 확인한다
+    missing_cids = {cid for cid in cid_list if not card_cache.lookup((KEY_CID_ENGLISH, str(cid)))[1]}
+
+    for deck in decks:
+        cards = deck.pop('cards', None)
+        if cards is None:
+            continue
+        for section in sections:
+            for cid in cards[section]:
+                if cid in missing_cids:
+                    deck['missing'].append(cid)
+                result = card_results.get(cid)
+                if result is None:
+                    continue
+                if section == 'side':
+                    deck['side_score'] += result[1]
+                else:
+                    deck['main_score'] += result[1]
+
+    for deck in decks:
+        deck['total'] = deck['main_score'] + deck['side_score']
+    decks.sort(key=lambda deck: (deck['error'] is not None, -deck['total']))
+    return decks
+
+def calculate_bulk_url_score(urls, points, result_text_widget, app_instance, options):
+    try:
+        app_instance.root.after(0, lambda: app_instance.calculate_url_btn.config(state=tk.DISABLED))
+
+        result_text_widget.config(state=tk.NORMAL)
+        result_text_widget.delete(1.0, tk.END)
+
+        report_status = lambda text: app_instance.root.after(0, lambda: app_instance.status_label.config(text=text))
+        decks = score_neuron_urls(urls, points, options, report_status)
+
+        result_text_widget.insert(tk.END, f"--- 덱 순위 ({len(decks)}개) ---\n")
+        for rank, deck in enumerate(decks, start=1):
+            if deck['error']:
+                result_text_widget.insert(tk.END, f"\n-. {deck['title']}\n   {deck['url']}\n   오류: {deck['error']}\n")
+                continue
+
+            result_text_widget.insert(tk.END, f"\n{rank}. {deck['title']} - {deck['total']}")
+            if options['include_side_deck']:
+                result_text_widget.insert(tk.END, f" (메인 {deck['main_score']} / 사이드 {deck['side_score']})")
+            result_text_widget.insert(tk.END, f"\n   {deck['url']}\n")
+            if deck['missing']:
+                result_text_widget.insert(tk.END, f"   경고: 확인할 수 없는 카드 {len(deck['missing'])}장 (cid: {', '.join(deck['missing'])})\n")
+
+    except Exception as e:
+        result_text_widget.insert(tk.END, f"오류 발생: {e}\n")
+    finally:
+        save_caches(app_instance)
+        result_text_widget.config(state=tk.DISABLED)
+        app_instance.root.after(0, lambda: app_instance.calculate_url_btn.config(state=tk.NORMAL))
+        app_instance.root.after(0, lambda: app_instance.status_label.config(text="준비 완료."))
+
+def aggregate_cards(cards_list):
+    card_count = count_cards(cards_list)
     
     aggregated = []
     for name, data in card_count.items():
@@ -452,6 +992,109 @@ def aggregate_cards(cards_list):
     
     return aggregated
 
+def suggest_point_cuts(main_cards, other_cards, budget, main_deck_size, min_deck_size=MIN_MAIN_DECK_SIZE, locked_names=(), top_n=CUT_SUGGESTION_COUNT):
+    # main_cards 는 메인 덱 매수에 포함되는 카드, other_cards 는 엑스트라/사이드 카드
+    total_score = sum(score for _, score in main_cards) + sum(score for _, score in other_cards)
+    excess = total_score - budget
+    if excess <= 0:
+        return []
+
+    groups = []
+    for is_main, cards_list in ((True, main_cards), (False, other_cards)):
+        for name, data in count_cards(cards_list).items():
+            if name in locked_names or data['unit_score'] <= 0:
+                continue
+            groups.append((name, data['unit_score'], data['count'], is_main))
+    if not groups:
+        return []
+
+    max_main_cuts = max(0, main_deck_size - min_deck_size)
+
+    # 잠기지 않은 카드를 모두 빼도(메인 덱은 최소 매수까지만) 예산을 맞출 수 없으면 바로 끝낸다
+    main_copy_scores = sorted((unit_score for _, unit_score, count, is_main in groups if is_main for _ in range(count)), reverse=True)
+    removable_score = sum(main_copy_scores[:max_main_cuts]) + sum(unit_score * count for _, unit_score, count, is_main in groups if not is_main)
+    if removable_score < excess:
+        return []
+
+    step = 0
+    for _, unit_score, _, _ in groups:
+        step = gcd(step, unit_score)
+    need = -(-excess // step)
+
+    # states[제거 포인트][메인 덱 제거 매수] = 제거 매수가 적은 순으로 top_n 개의 (매수, 제거 포인트, 컷 목록)
+    states = [[[] for _ in range(max_main_cuts + 1)] for _ in range(need + 1)]
+    states[0][0].append((0, 0, ()))
+
+    # remaining_units[i] = i 번째 그룹부터 끝까지 모두 뺐을 때 줄일 수 있는 포인트
+    remaining_units = [0] * (len(groups) + 1)
+    for index in range(len(groups) - 1, -1, -1):
+        remaining_units[index] = remaining_units[index + 1] + groups[index][1] // step * groups[index][2]
+
+    for index, (name, unit_score, count, is_main) in enumerate(groups):
+        weight = unit_score // step
+        # 이미 top_n 개의 해가 있으면 그보다 매수가 많아질 후보는 더 볼 필요가 없다
+        finished = heapq.nsmallest(top_n, (entry[0] for bucket in states[need] for entry in bucket))
+        max_copies = finished[-1] if len(finished) == top_n else float('inf')
+        # 표 전체를 복사하지 않고, 새로 생긴 후보만 모았다가 해당 칸에만 합친다
+        additions = {}
+        for removed in range(max(0, need - remaining_units[index]), need + 1):
+            for main_cuts, bucket in enumerate(states[removed]):
+                for copies, removed_units, cuts in bucket:
+                    if copies + 1 > max_copies:
+                        continue
+                    for k in range(1, count + 1):
+                        next_main_cuts = main_cuts + k if is_main else main_cuts
+                        if next_main_cuts > max_main_cuts:
+                            break
+                        next_removed = min(need, removed + k * weight)
+                        additions.setdefault((next_removed, next_main_cuts), []).append(
+                            (copies + k, removed_units + k * weight, cuts + ((name, is_main, k),))
+                        )
+        for (removed, main_cuts), entries in additions.items():
+            states[removed][main_cuts] = heapq.nsmallest(top_n, states[removed][main_cuts] + entries)
+
+    candidates = heapq.nsmallest(top_n, (entry for bucket in states[need] for entry in bucket))
+
+    # 같은 카드라도 메인 덱과 엑스트라/사이드의 컷은 서로 다른 조합이므로 구역별로 남긴다
+    suggestions = []
+    for copies, removed_units, cuts in candidates:
+        removed_points = removed_units * step
+        suggestions.append({
+            'cuts': list(cuts),
+            'removed_copies': copies,
+            'removed_points': removed_points,
+            'remaining_points': total_score - removed_points
+        })
+    return suggestions
+
+def insert_cut_suggestions(result_text_widget, main_cards, other_cards, main_deck_size, options):
+    budget = options.get('point_budget')
+    if budget is None:
+        return
+
+    result_text_widget.insert(tk.END, f"\n--- 컷 제안 (상한 {budget}) ---\n")
+    total_score = sum(score for _, score in main_cards) + sum(score for _, score in other_cards)
+    if total_score <= budget:
+        result_text_widget.insert(tk.END, "포인트 상한 이내입니다.\n")
+        return
+
+    suggestions = suggest_point_cuts(main_cards, other_cards, budget, main_deck_size, locked_names=options.get('locked_cards', ()))
+    if not suggestions:
+        result_text_widget.insert(tk.END, "조건을 만족하는 컷 조합이 없습니다.\n")
+        return
+
+    # 메인 덱과 엑스트라/사이드 양쪽에 있는 카드는 어느 쪽에서 빼는지 함께 표시한다
+    shared_names = {name for name, _ in main_cards} & {name for name, _ in other_cards}
+    for index, suggestion in enumerate(suggestions, start=1):
+        cuts_text = ", ".join(
+            f"{name} x{k}" + ((" (메인)" if is_main else " (엑스트라/사이드)") if name in shared_names else "")
+            for name, is_main, k in suggestion['cuts']
+        )
+        result_text_widget.insert(
+            tk.END,
+            f"{index}. {cuts_text} (-{suggestion['removed_points']}, {suggestion['removed_copies']}장 제외 → {suggestion['remaining_points']})\n"
+        )
+
 def load_points(app, points_filename):
     points = {}
     
@@ -494,6 +1137,363 @@ def load_points(app, points_filename):
     
     return points
 
+def card_name_key(card_name):
+    return int.from_bytes(hashlib.blake2b(card_name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def write_compiled_table(table_path, entries, source_mtime_ns=0, source_size=0):
+    name_offsets = {}
+    names_blob = bytearray()
+    packed_entries = []
+
+    for key, value, name in sorted(entries, key=lambda entry: entry[0]):
+        if name not in name_offsets:
+            encoded_name = name.encode('utf-8')
+            name_offsets[name] = len(names_blob)
+            names_blob += COMPILED_TABLE_NAME_LENGTH.pack(len(encoded_name)) + encoded_name
+        packed_entries.append(COMPILED_TABLE_ENTRY.pack(key, value, name_offsets[name]))
+
+    names_offset = COMPILED_TABLE_HEADER.size + COMPILED_TABLE_ENTRY.size * len(packed_entries)
+    header = COMPILED_TABLE_HEADER.pack(
+        COMPILED_TABLE_MAGIC, COMPILED_TABLE_VERSION,
+        source_mtime_ns, source_size,
+        len(packed_entries), names_offset
+    )
+
+    temp_path = f"{table_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(b''.join(packed_entries))
+        f.write(names_blob)
+    os.replace(temp_path, table_path)
+
+class CompiledTable:
+    def __init__(self, table_path):
+        with open(table_path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.buffer) < COMPILED_TABLE_HEADER.size:
+            self.close()
+            raise ValueError(f"{table_path} 파일이 손상되었습니다.")
+
+        magic, version, self.source_mtime_ns, self.source_size, self.count, self.names_offset = COMPILED_TABLE_HEADER.unpack_from(self.buffer, 0)
+        if magic != COMPILED_TABLE_MAGIC or version != COMPILED_TABLE_VERSION:
+            self.close()
+            raise ValueError(f"{table_path} 파일의 형식이 올바르지 않습니다.")
+
+    def __len__(self):
+        return self.count
+
+    def is_compiled_from(self, source_stat):
+        return self.source_mtime_ns == source_stat.st_mtime_ns and self.source_size == source_stat.st_size
+
+    def entry(self, index):
+        return COMPILED_TABLE_ENTRY.unpack_from(self.buffer, COMPILED_TABLE_HEADER.size + index * COMPILED_TABLE_ENTRY.size)
+
+    def name_at(self, name_offset):
+        position = self.names_offset + name_offset
+        (length,) = COMPILED_TABLE_NAME_LENGTH.unpack_from(self.buffer, position)
+        position += COMPILED_TABLE_NAME_LENGTH.size
+        return self.buffer[position:position + length].decode('utf-8')
+
+    def lookup(self, key):
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.entry(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        matches = []
+        for index in range(low, self.count):
+            entry_key, value, name_offset = self.entry(index)
+            if entry_key != key:
+                break
+            matches.append((value, self.name_at(name_offset)))
+        return matches
+
+    def items(self):
+        for index in range(self.count):
+            _, value, name_offset = self.entry(index)
+            yield self.name_at(name_offset), value
+
+    def close(self):
+        self.buffer.close()
+
+class CompiledPoints:
+    def __init__(self, table):
+        self.table = table
+
+    def get(self, card_name, default=None):
+        for value, name in self.table.lookup(card_name_key(card_name)):
+            if name == card_name:
+                return value
+        return default
+
+    def __contains__(self, card_name):
+        return self.get(card_name) is not None
+
+    def __getitem__(self, card_name):
+        value = self.get(card_name)
+        if value is None:
+            raise KeyError(card_name)
+        return value
+
+    def __len__(self):
+        return len(self.table)
+
+    def items(self):
+        return self.table.items()
+
+def compiled_table_path(source_filename):
+    return resource_path(source_filename + COMPILED_TABLE_SUFFIX)
+
+def load_compiled_points(app, points_filename):
+    source_path = resource_path(points_filename)
+    table_path = compiled_table_path(points_filename)
+
+    try:
+        source_stat = os.stat(source_path)
+    except FileNotFoundError:
+        return load_points(app, points_filename)
+
+    try:
+        table = CompiledTable(table_path)
+        if table.is_compiled_from(source_stat):
+            return CompiledPoints(table)
+        table.close()
+    except (OSError, ValueError):
+        pass
+
+    points = load_points(app, points_filename)
+    if points is None:
+        return None
+
+    try:
+        entries = [(card_name_key(name), score, name) for name, score in points.items()]
+        write_compiled_table(table_path, entries, source_stat.st_mtime_ns, source_stat.st_size)
+        return CompiledPoints(CompiledTable(table_path))
+    except (OSError, ValueError) as e:
+        print(f"포인트 테이블 컴파일 오류, 텍스트 룰을 사용합니다: {e}")
+        return points
+
+class CompiledIdentities:
+    def __init__(self, table):
+        self.table = table
+
+    def get(self, passcode, default=None):
+        # ydk 파일에 숫자가 아닌 줄이 섞여 있으면 이름을 모르는 카드로 취급한다
+        if not str(passcode).isdigit():
+            return default
+        for _, name in self.table.lookup(int(passcode)):
+            return name
+        return default
+
+def write_identity_table(table_path):
+    entries = [(int(key[1]), 0, name) for key, name, _ in card_cache.snapshot((KEY_PASSCODE_ENGLISH,)) if name and key[1].isdigit()]
+    write_compiled_table(table_path, entries)
+
+batch_worker_state = {}
+
+def init_batch_worker(points_filename, identity_table_path, include_side_deck):
+    batch_worker_state['points'] = load_compiled_points(None, points_filename)
+    batch_worker_state['identities'] = CompiledIdentities(CompiledTable(identity_table_path))
+    batch_worker_state['include_side_deck'] = include_side_deck
+
+def score_deck_file_worker(ydk_file):
+    points = batch_worker_state['points']
+    identities = batch_worker_state['identities']
+
+    try:
+        deck = parse_ydk_file(ydk_file)
+    except (OSError, UnicodeDecodeError) as e:
+        return None, None, (), str(e)
+
+    main_total = 0
+    side_total = 0
+    missing = []
+    for section in ('main', 'extra', 'side'):
+        if section == 'side' and not batch_worker_state['include_side_deck']:
+            continue
+        for passcode in deck[section]:
+            card_name_en = identities.get(passcode)
+            if card_name_en is None:
+                missing.append(int(passcode) if passcode.isdigit() else passcode)
+                continue
+            if section == 'side':
+                side_total += points.get(card_name_en, 0)
+            else:
+                main_total += points.get(card_name_en, 0)
+
+    return main_total, side_total, tuple(missing), None
+
+def find_ydk_files(paths):
+    ydk_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, _, filenames in os.walk(path):
+                ydk_files.extend(os.path.join(dir_path, f) for f in sorted(filenames) if f.endswith(".ydk"))
+        elif path.endswith(".ydk"):
+            ydk_files.append(path)
+    return ydk_files
+
+def prepare_points_file(points_filename):
+    if points_filename and os.path.exists(resource_path(points_filename)):
+        return points_filename
+
+    points_files = get_points_files_from_github()
+    if points_filename:
+        points_files = [file_info for file_info in points_files if file_info['filename'] == points_filename]
+    if not points_files:
+        return None
+
+    selected_file = points_files[0]
+    if not download_points_file(selected_file['download_url'], selected_file['filename']):
+        return None
+    return selected_file['filename']
+
+def format_batch_row(ydk_file, main_total, side_total, missing, error):
+    if error:
+        return f"{ydk_file}\t\t\t\t오류: {error}\n"
+    return f"{ydk_file}\t{main_total}\t{side_total}\t{main_total + side_total}\t{len(missing)}\n"
+
+def score_deck_files_in_pool(ydk_files, points_filename, identity_table_path, workers, include_side_deck):
+    total = len(ydk_files)
+    chunksize = max(1, min(256, total // (workers * 8)))
+    start_time = time.time()
+    last_report_time = start_time
+
+    with multiprocessing.Pool(workers, initializer=init_batch_worker, initargs=(points_filename, identity_table_path, include_side_deck)) as pool:
+        results = pool.imap(score_deck_file_worker, ydk_files, chunksize=chunksize)
+        for done, (ydk_file, result) in enumerate(zip(ydk_files, results), start=1):
+            yield ydk_file, result
+
+            current_time = time.time()
+            if current_time - last_report_time >= BATCH_PROGRESS_INTERVAL or done == total:
+                last_report_time = current_time
+                elapsed = current_time - start_time
+                rate = done / elapsed if elapsed > 0 else 0
+                print(f"\r진행: {done}/{total} ({rate:.0f} 덱/초)", end="", file=sys.stderr, flush=True)
+
+    elapsed = time.time() - start_time
+    print(f"\n완료: {total}개 덱, {elapsed:.1f}초", file=sys.stderr)
+
+def run_batch_scoring(ydk_files, points_filename, output, workers, include_side_deck, resolve_missing):
+    load_caches()
+    if load_compiled_points(None, points_filename) is None:
+        print(f"오류: {points_filename} 포인트 파일을 불러올 수 없습니다.", file=sys.stderr)
+        return 1
+
+    identity_table_path = resource_path(IDENTITY_TABLE_FILENAME)
+    write_identity_table(identity_table_path)
+
+    # 누락 카드를 조회하는 경우에는 해당 덱을 다시 계산해 같은 자리에 쓸 수 있도록 결과를 모아 두었다가 출력한다
+    rows = []
+    incomplete_decks = {}
+    missing_passcodes = set()
+
+    output.write("file\tmain\tside\ttotal\tmissing\n")
+    for index, (ydk_file, result) in enumerate(score_deck_files_in_pool(ydk_files, points_filename, identity_table_path, workers, include_side_deck)):
+        missing = result[2]
+        if missing:
+            incomplete_decks[index] = ydk_file
+            missing_passcodes.update(missing)
+        if resolve_missing:
+            rows.append(format_batch_row(ydk_file, *result))
+        else:
+            output.write(format_batch_row(ydk_file, *result))
+
+    if missing_passcodes and resolve_missing:
+        print(f"이름을 확인하지 못한 카드 {len(missing_passcodes)}종을 조회합니다.", file=sys.stderr)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            resolved = sum(1 for name in executor.map(get_english_name_from_passcode, missing_passcodes) if name)
+        save_caches()
+        print(f"{resolved}종의 카드 이름을 새로 확인했습니다.", file=sys.stderr)
+
+        if resolved:
+            write_identity_table(identity_table_path)
+            missing_passcodes = set()
+            rescored = score_deck_files_in_pool(list(incomplete_decks.values()), points_filename, identity_table_path, workers, include_side_deck)
+            for (ydk_file, result), index in zip(rescored, list(incomplete_decks)):
+                rows[index] = format_batch_row(ydk_file, *result)
+                if result[2]:
+                    missing_passcodes.update(result[2])
+                else:
+                    del incomplete_decks[index]
+    output.writelines(rows)
+
+    if missing_passcodes:
+        print(f"이름을 확인하지 못한 카드 {len(missing_passcodes)}종 (해당 덱 {len(incomplete_decks)}개)", file=sys.stderr)
+
+    return 0
+
+def read_url_list(url_file):
+    with open(url_file, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip().startswith('http')]
+
+def run_url_scoring(urls, points_filename, output, include_side_deck):
+    load_caches()
+    points = load_compiled_points(None, points_filename)
+    if points is None:
+        print(f"오류: {points_filename} 포인트 파일을 불러올 수 없습니다.", file=sys.stderr)
+        return 1
+
+    options = {
+        'show_zero_points': False,
+        'scrape_yugipedia': False,
+        'include_side_deck': include_side_deck,
+        'offline_mode': False
+    }
+    decks = score_neuron_urls(urls, points, options, lambda text: print(text, file=sys.stderr))
+
+    output.write("rank\ttotal\tmain\tside\tmissing\ttitle\turl\n")
+    for rank, deck in enumerate(decks, start=1):
+        if deck['error']:
+            output.write(f"-\t\t\t\t\t오류: {deck['error']}\t{deck['url']}\n")
+            continue
+        output.write(f"{rank}\t{deck['total']}\t{deck['main_score']}\t{deck['side_score']}\t{','.join(deck['missing'])}\t{deck['title']}\t{deck['url']}\n")
+
+    save_caches()
+    return 0
+
+def run_cli(argv):
+    parser = argparse.ArgumentParser(description="ydk 덱 파일 또는 뉴런 덱 URL의 제네시스 포인트를 일괄 계산합니다.")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--batch', nargs='+', metavar='PATH', help="ydk 파일 또는 덱 폴더")
+    source_group.add_argument('--urls', metavar='FILE', help="한 줄에 하나씩 뉴런 덱 URL을 적은 파일")
+    parser.add_argument('--rule', help="포인트 룰 파일 이름 (예: 251027.txt, 생략시 최신)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="작업 프로세스 수")
+    parser.add_argument('--side', action='store_true', help="사이드 덱 포함")
+    parser.add_argument('--output', help="결과 파일 (생략시 표준 출력)")
+    parser.add_argument('--resolve-missing', action='store_true', help="이름을 확인하지 못한 카드를 조회해 캐시에 저장")
+    args = parser.parse_args(argv)
+
+    points_filename = prepare_points_file(args.rule)
+    if not points_filename:
+        print("오류: 포인트 파일을 가져올 수 없습니다.", file=sys.stderr)
+        return 1
+
+    if args.urls:
+        urls = read_url_list(args.urls)
+        if not urls:
+            print("오류: URL이 없습니다.", file=sys.stderr)
+            return 1
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as output:
+                return run_url_scoring(urls, points_filename, output, args.side)
+        return run_url_scoring(urls, points_filename, sys.stdout, args.side)
+
+    ydk_files = find_ydk_files(args.batch)
+    if not ydk_files:
+        print("오류: ydk 파일이 없습니다.", file=sys.stderr)
+        return 1
+
+    workers = max(1, args.workers)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            return run_batch_scoring(ydk_files, points_filename, output, workers, args.side, args.resolve_missing)
+    return run_batch_scoring(ydk_files, points_filename, sys.stdout, workers, args.side, args.resolve_missing)
+
 class DeckFileHandler(FileSystemEventHandler):
     def __init__(self, app_instance):
         self.app_instance = app_instance
@@ -503,6 +1503,8 @@ class DeckFileHandler(FileSystemEventHandler):
         if not event.is_directory and event.src_path.endswith('.ydk'):
             file_path = event.src_path
             current_time = time.time()
+            # 목록의 수정 시각은 매번 갱신하고, 자동 계산만 1초 간격으로 제한한다
+            self.app_instance.root.after(0, lambda: self.app_instance.on_deck_file_changed(file_path))
             
             if file_path in self.last_modified:
                 if current_time - self.last_modified[file_path] < 1.0:
@@ -516,92 +1518,428 @@ class DeckFileHandler(FileSystemEventHandler):
     
     def on_created(self, event):
         if not event.is_directory and event.src_path.endswith('.ydk'):
-            self.app_instance.root.after(0, self.app_instance.update_deck_list)
+            file_path = event.src_path
+            self.app_instance.root.after(0, lambda: self.app_instance.on_deck_file_changed(file_path))
 
-def calculate_deck_score_api(ydk_file, points, result_text_widget, app_instance, options):
-    try:
-        app_instance.root.after(0, lambda: app_instance.calculate_btn.config(state=tk.DISABLED))
-        app_instance.root.after(0, lambda: app_instance.status_label.config(text="계산 중..."))
+    def on_deleted(self, event):
+        if not event.is_directory and event.src_path.endswith('.ydk'):
+            file_path = event.src_path
+            self.app_instance.root.after(0, lambda: self.app_instance.on_deck_file_removed(file_path))
 
-        result_text_widget.config(state=tk.NORMAL)
-        result_text_widget.delete(1.0, tk.END)
-        
-        main_deck_passcodes = []
-        side_deck_passcodes = []
-        is_side_deck = False
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+        if event.src_path.endswith('.ydk'):
+            src_path = event.src_path
+            self.app_instance.root.after(0, lambda: self.app_instance.on_deck_file_removed(src_path))
+        if event.dest_path.endswith('.ydk'):
+            dest_path = event.dest_path
+            self.app_instance.root.after(0, lambda: self.app_instance.on_deck_file_changed(dest_path))
+
+def name_trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def is_fuzzy_match(query, text):
+    remaining = iter(text)
+    return all(char in remaining for char in query)
+
+class DeckSearchIndex:
+    def __init__(self):
+        self.mtimes = {}
+        self.lowered_names = {}
+        self.trigrams = {}
+
+    def rebuild(self, entries):
+        self.mtimes.clear()
+        self.lowered_names.clear()
+        self.trigrams.clear()
+        for name, mtime in entries:
+            self.add(name, mtime)
+
+    def add(self, name, mtime):
+        if name in self.mtimes:
+            self.mtimes[name] = mtime
+            return
 
-        with open(ydk_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line == "!side":
-                    is_side_deck = True
+        lowered_name = name.lower()
+        self.mtimes[name] = mtime
+        self.lowered_names[name] = lowered_name
+        for trigram in name_trigrams(lowered_name):
+            self.trigrams.setdefault(trigram, set()).add(name)
+
+    def remove(self, name):
+        lowered_name = self.lowered_names.pop(name, None)
+        if lowered_name is None:
+            return
+
+        del self.mtimes[name]
+        for trigram in name_trigrams(lowered_name):
+            postings = self.trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(name)
+                if not postings:
+                    del self.trigrams[trigram]
+
+    def search(self, query, fuzzy=False):
+        query = query.lower()
+        if not query:
+            return list(self.mtimes), []
+
+        if len(query) >= 3:
+            postings = sorted((self.trigrams.get(trigram, set()) for trigram in name_trigrams(query)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = self.mtimes.keys()
+        matches = [name for name in candidates if query in self.lowered_names[name]]
+
+        fuzzy_matches = []
+        if fuzzy:
+            matched = set(matches)
+            fuzzy_matches = [
+                name for name, lowered_name in self.lowered_names.items()
+                if name not in matched and is_fuzzy_match(query, lowered_name)
+            ]
+        return matches, fuzzy_matches
+
+def parse_ydk_lines(lines):
+    deck = {
+        'main': [],
+        'extra': [],
+        'side': []
+    }
+    section = 'main'
+
+    for line in lines:
+        line = line.strip()
+        if line == "#main":
+            section = 'main'
+            continue
+        if line == "#extra":
+            section = 'extra'
+            continue
+        if line == "!side":
+            section = 'side'
+            continue
+        if line.startswith(('#', '!')) or not line:
+            continue
+
+        deck[section].append(line)
+
+    return deck
+
+def parse_ydk_file(ydk_file):
+    with open(ydk_file, "r", encoding="utf-8") as f:
+        return parse_ydk_lines(f)
+
+def decode_ydke(deck_code):
+    deck_code = deck_code.strip()
+    if not deck_code.startswith(YDKE_PREFIX):
+        raise ValueError("ydke:// 형식의 덱 코드가 아닙니다.")
+
+    sections = deck_code[len(YDKE_PREFIX):].split('!')
+    if len(sections) < 3:
+        raise ValueError("덱 코드에 메인/엑스트라/사이드 구역이 모두 있어야 합니다.")
+
+    deck = {}
+    for section, encoded in zip(('main', 'extra', 'side'), sections):
+        raw = base64.b64decode(encoded, validate=True)
+        if len(raw) % 4:
+            raise ValueError("덱 코드의 길이가 올바르지 않습니다.")
+
+        passcodes = array('I')
+        passcodes.frombytes(raw)
+        if sys.byteorder == 'big':
+            passcodes.byteswap()
+        deck[section] = passcodes.tolist()
+
+    return deck
+
+def encode_ydke(deck):
+    encoded_sections = []
+    for section in ('main', 'extra', 'side'):
+        passcodes = array('I', (int(passcode) for passcode in deck[section]))
+        if sys.byteorder == 'big':
+            passcodes.byteswap()
+        encoded_sections.append(base64.b64encode(passcodes.tobytes()).decode('ascii'))
+
+    return YDKE_PREFIX + "!".join(encoded_sections) + "!"
+
+def parse_deck_code(deck_code):
+    deck_code = deck_code.strip()
+    if deck_code.startswith(YDKE_PREFIX):
+        return decode_ydke(deck_code)
+
+    deck = parse_ydk_lines(deck_code.splitlines())
+    if not any(deck.values()) or not all(passcode.isdigit() for section in deck.values() for passcode in section):
+        raise ValueError("지원하지 않는 덱 코드 형식입니다. ydke:// 코드 또는 ydk 내용을 입력해주세요.")
+    return deck
+
+class CacheWarmer:
+    def __init__(self):
+        self.queue = []
+        self.queued = {}
+        self.deferred = {}
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.scanned_files = {}
+        self.scan_lock = threading.Lock()
+        self.active_calculations = 0
+        self.idle = threading.Event()
+        self.idle.set()
+        self.offline = False
+        self.scrape_korean = True
+        self.backoff = WARMER_REQUEST_INTERVAL
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def configure(self, options):
+        self.offline = options['offline_mode']
+        self.scrape_korean = options['scrape_yugipedia']
+        if not self.offline:
+            self.retry_deferred()
+
+    def is_resolved(self, passcode):
+        found, card_name_en, _ = card_cache.lookup((KEY_PASSCODE_ENGLISH, passcode))
+        if not found:
+            return False
+        # 없는 카드로 확인된 패스코드는 한글 이름을 조회하지 않는다
+        return card_name_en is None or card_cache.lookup((KEY_PASSCODE_KOREAN, passcode))[0]
+
+    def add_passcodes(self, passcodes, priority):
+        with self.condition:
+            for passcode in passcodes:
+                passcode = str(passcode)
+                current_priority = self.queued.get(passcode)
+                if current_priority is not None and current_priority <= priority:
                     continue
-                if line.startswith(('#', '!')) or not line:
+                if self.is_resolved(passcode):
                     continue
-                
-                if is_side_deck:
-                    side_deck_passcodes.append(line)
-                else:
-                    main_deck_passcodes.append(line)
-
-        main_deck_cards_to_display = []
-        main_deck_total_score = 0
-        side_deck_cards_to_display = []
-        side_deck_total_score = 0
-        grand_total_score = 0
+                self.queued[passcode] = priority
+                heapq.heappush(self.queue, (priority, next(self.sequence), passcode))
+            self.condition.notify()
+
+    def defer(self, passcode, priority):
+        with self.condition:
+            current_priority = self.deferred.get(passcode)
+            if current_priority is None or priority < current_priority:
+                self.deferred[passcode] = priority
+
+    def retry_deferred(self):
+        # 오프라인이거나 조회에 실패해 미뤄 둔 패스코드를 다시 큐에 넣는다
+        with self.condition:
+            deferred, self.deferred = self.deferred, {}
+        for priority in sorted(set(deferred.values())):
+            self.add_passcodes([passcode for passcode, deferred_priority in deferred.items() if deferred_priority == priority], priority)
+
+    def warm_folder(self, deck_folder, ydk_files):
+        paths = [os.path.join(deck_folder, ydk_file) for ydk_file in ydk_files]
+        threading.Thread(target=self.scan_files, args=(paths,), daemon=True).start()
+
+    def scan_files(self, paths):
+        with self.scan_lock:
+            passcodes = set()
+            for path in paths:
+                try:
+                    mtime = os.path.getmtime(path)
+                    if self.scanned_files.get(path) == mtime:
+                        continue
+                    deck = parse_ydk_file(path)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                self.scanned_files[path] = mtime
+                for section in deck.values():
+                    passcodes.update(section)
+            self.add_passcodes(passcodes, WARMER_FOLDER_PRIORITY)
 
-        app_instance.root.after(0, lambda: app_instance.status_label.config(text="메인 덱 카드 정보 가져오는 중..."))
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            fetch_func = lambda p: fetch_card_data(p, points, options, app_instance)
-            main_deck_results = list(executor.map(fetch_func, main_deck_passcodes))
+    def prioritize_deck(self, ydk_file):
+        try:
+            deck = parse_ydk_file(ydk_file)
+        except (OSError, UnicodeDecodeError):
+            return
+        self.add_passcodes([passcode for section in deck.values() for passcode in section], WARMER_SELECTED_PRIORITY)
+
+    def begin_interactive(self):
+        with self.condition:
+            self.active_calculations += 1
+            self.idle.clear()
+
+    def end_interactive(self):
+        with self.condition:
+            self.active_calculations -= 1
+            if self.active_calculations == 0:
+                self.idle.set()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.queue:
+                    self.condition.wait()
+                priority, _, passcode = heapq.heappop(self.queue)
+                if self.queued.get(passcode) != priority:
+                    continue
+                del self.queued[passcode]
+
+            # 사용자가 요청한 계산이 진행 중이면 끝날 때까지 기다린다
+            self.idle.wait()
+            if self.is_resolved(passcode):
+                continue
+            if self.offline:
+                self.defer(passcode, priority)
+                continue
+
+            card_name_en = get_english_name_from_passcode(passcode)
+            if card_name_en:
+                card_name_ko = get_korean_name_from_passcode(passcode)
+                if self.scrape_korean and (not card_name_ko or card_name_ko == card_name_en):
+                    get_korean_name_from_konami(card_name_en)
+
+            # 없는 카드도 저장되므로, 저장되지 않았다면 요청 제한(429), 서버 오류(5xx), 연결 오류 중 하나다
+            if card_cache.lookup((KEY_PASSCODE_ENGLISH, passcode))[0]:
+                self.backoff = WARMER_REQUEST_INTERVAL
+                self.retry_deferred()
+            else:
+                self.defer(passcode, priority)
+                # 간격을 늘려 상류 서버 부담을 줄인다
+                self.backoff = min(self.backoff * 2, WARMER_MAX_BACKOFF)
+            time.sleep(self.backoff)
 
-        for result in main_deck_results:
-            if result is not None:
-                name, score = result
-                main_deck_cards_to_display.append((name, score))
-                main_deck_total_score += score
+def calculate_deck_score_api(ydk_file, points, result_text_widget, app_instance, options):
+    calculate_deck_score(lambda: parse_ydk_file(ydk_file), points, result_text_widget, app_instance, options, ydk_file)
+
+def calculate_deck_code_score(deck_code, points, result_text_widget, app_instance, options):
+    calculate_deck_score(lambda: parse_deck_code(deck_code), points, result_text_widget, app_instance, options)
+
+def check_deck_names(passcodes, options):
+    # fetch_card_data 가 쓰는 이름 캐시를 그대로 따라가며, 오래된 항목은 백그라운드에서 갱신하도록 예약한다
+    offline = options.get('offline_mode', False)
+    complete = True
+    for passcode in {str(passcode) for passcode in passcodes}:
+        found, card_name_en = cached_lookup((KEY_PASSCODE_ENGLISH, passcode), lambda passcode=passcode: get_english_name_from_passcode(passcode, refresh=True), offline)
+        if not found:
+            complete = False
+            continue
+        if not card_name_en:
+            continue
+
+        found, card_name_ko = cached_lookup((KEY_PASSCODE_KOREAN, passcode), lambda passcode=passcode: get_korean_name_from_passcode(passcode, refresh=True), offline)
+        if not found:
+            complete = False
+            continue
+        if options['scrape_yugipedia'] and (not card_name_ko or card_name_ko == card_name_en):
+            found, _ = cached_lookup((KEY_KONAMI_KOREAN, card_name_en), lambda card_name_en=card_name_en: get_korean_name_from_konami(card_name_en, refresh=True), offline)
+            complete = complete and found
+    return complete
+
+def score_deck(deck, points, options, app_instance):
+    main_deck_passcodes = deck['main'] + deck['extra']
+    side_deck_passcodes = deck['side'] if options['include_side_deck'] else []
+    main_only_count = len(deck['main'])
+
+    result = {
+        'main_cards': [],
+        'main_only_cards': [],
+        'extra_cards': [],
+        'side_cards': [],
+        'main_total': 0,
+        'side_total': 0,
+        'main_only_count': main_only_count
+    }
 
-        if options['include_side_deck'] and side_deck_passcodes:
-            app_instance.root.after(0, lambda: app_instance.status_label.config(text="사이드 덱 카드 정보 가져오는 중..."))
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                fetch_func = lambda p: fetch_card_data(p, points, options, app_instance)
-                side_deck_results = list(executor.map(fetch_func, side_deck_passcodes))
+    app_instance.root.after(0, lambda: app_instance.status_label.config(text="메인 덱 카드 정보 가져오는 중..."))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fetch_func = lambda p: fetch_card_data(p, points, options, app_instance)
+        main_deck_results = list(executor.map(fetch_func, main_deck_passcodes))
+
+    for index, card_result in enumerate(main_deck_results):
+        if card_result is not None:
+            name, score = card_result
+            result['main_cards'].append((name, score))
+            result['main_total'] += score
+            if index < main_only_count:
+                result['main_only_cards'].append((name, score))
+            else:
+                result['extra_cards'].append((name, score))
 
-            for result in side_deck_results:
-                if result is not None:
-                    name, score = result
-                    side_deck_cards_to_display.append((name, score))
-                    side_deck_total_score += score
+    if side_deck_passcodes:
+        app_instance.root.after(0, lambda: app_instance.status_label.config(text="사이드 덱 카드 정보 가져오는 중..."))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            fetch_func = lambda p: fetch_card_data(p, points, options, app_instance)
+            side_deck_results = list(executor.map(fetch_func, side_deck_passcodes))
+
+        for card_result in side_deck_results:
+            if card_result is not None:
+                name, score = card_result
+                result['side_cards'].append((name, score))
+                result['side_total'] += score
+
+    result['unresolved'] = [
+        str(passcode) for passcode in main_deck_passcodes + side_deck_passcodes
+        if not card_cache.lookup((KEY_PASSCODE_ENGLISH, str(passcode)))[1]
+    ]
+    # 한글 이름 조회까지 모두 캐시에 있어야 완성된 결과로 본다. 없는 카드로 확인된 패스코드는 다시 조회해도 결과가 같다
+    result['complete'] = check_deck_names(main_deck_passcodes + side_deck_passcodes, options)
+    return result
 
-        result_text_widget.insert(tk.END, f"--- 메인 덱 ---\n")
+def render_deck_result(result_text_widget, result, options):
+    result_text_widget.insert(tk.END, f"--- 메인 덱 ---\n")
+    if options['aggregate_same_cards']:
+        aggregated_main = aggregate_cards(result['main_cards'])
+        for name, total_score, unit_score in aggregated_main:
+            if "x" in name:
+                result_text_widget.insert(tk.END, f"{name} - {total_score} ({unit_score})\n")
+            else:
+                result_text_widget.insert(tk.END, f"{name} - {total_score}\n")
+    else:
+        for name, score in result['main_cards']:
+            result_text_widget.insert(tk.END, f"{name} - {score}\n")
+    result_text_widget.insert(tk.END, f"\n메인 덱 포인트: {result['main_total']}\n")
+
+    if options['include_side_deck']:
+        result_text_widget.insert(tk.END, f"\n--- 사이드 덱 ---\n")
         if options['aggregate_same_cards']:
-            aggregated_main = aggregate_cards(main_deck_cards_to_display)
-            for name, total_score, unit_score in aggregated_main:
+            aggregated_side = aggregate_cards(result['side_cards'])
+            for name, total_score, unit_score in aggregated_side:
                 if "x" in name:
                     result_text_widget.insert(tk.END, f"{name} - {total_score} ({unit_score})\n")
                 else:
                     result_text_widget.insert(tk.END, f"{name} - {total_score}\n")
         else:
-            for name, score in main_deck_cards_to_display:
+            for name, score in result['side_cards']:
                 result_text_widget.insert(tk.END, f"{name} - {score}\n")
-        result_text_widget.insert(tk.END, f"\n메인 덱 포인트: {main_deck_total_score}\n")
+        result_text_widget.insert(tk.END, f"\n사이드 덱 포인트: {result['side_total']}\n")
 
-        if options['include_side_deck']:
-            result_text_widget.insert(tk.END, f"\n--- 사이드 덱 ---\n")
-            if options['aggregate_same_cards']:
-                aggregated_side = aggregate_cards(side_deck_cards_to_display)
-                for name, total_score, unit_score in aggregated_side:
-                    if "x" in name:
-                        result_text_widget.insert(tk.END, f"{name} - {total_score} ({unit_score})\n")
-                    else:
-                        result_text_widget.insert(tk.END, f"{name} - {total_score}\n")
-            else:
-                for name, score in side_deck_cards_to_display:
-                    result_text_widget.insert(tk.END, f"{name} - {score}\n")
-            result_text_widget.insert(tk.END, f"\n사이드 덱 포인트: {side_deck_total_score}\n")
+    grand_total_score = result['main_total'] + result['side_total']
+    result_text_widget.insert(tk.END, f"\n--- 전체 포인트: {grand_total_score} ---\n")
+    if result.get('unresolved'):
+        result_text_widget.insert(tk.END, f"경고: 확인할 수 없는 카드 {len(result['unresolved'])}장은 포인트에 포함되지 않았습니다. (password: {', '.join(result['unresolved'])})\n")
 
-        grand_total_score = main_deck_total_score + side_deck_total_score
-        result_text_widget.insert(tk.END, f"\n--- 전체 포인트: {grand_total_score} ---\n")
+    insert_cut_suggestions(result_text_widget, result['main_only_cards'], result['extra_cards'] + result['side_cards'], result['main_only_count'], options)
+
+def calculate_deck_score(load_deck, points, result_text_widget, app_instance, options, ydk_file=None):
+    try:
+        app_instance.root.after(0, lambda: app_instance.calculate_btn.config(state=tk.DISABLED))
+        app_instance.root.after(0, lambda: app_instance.status_label.config(text="계산 중..."))
+
+        result_text_widget.config(state=tk.NORMAL)
+        result_text_widget.delete(1.0, tk.END)
+
+        deck = load_deck()
+        app_instance.last_scored_deck = deck
+
+        result_key = deck_result_key(deck, options)
+        result = deck_result_cache.get(result_key)
+        if result is None:
+            result = score_deck(deck, points, options, app_instance)
+            if result['complete']:
+                deck_result_cache.store(result_key, result)
+        else:
+            # 저장된 결과를 쓰더라도 오래된 카드 이름은 갱신되도록 한다. 이름이 바뀌면 결과 캐시가 비워지고 다시 계산된다
+            check_deck_names(deck['main'] + deck['extra'] + (deck['side'] if options['include_side_deck'] else []), options)
+
+        render_deck_result(result_text_widget, result, options)
+
+        if ydk_file and result['complete']:
+            deck_result_cache.record_file_total(ydk_file, options['rule_version'], result['main_total'] + result['side_total'])
+            app_instance.root.after(0, app_instance.filter_deck_list)
 
     except Exception as e:
         result_text_widget.insert(tk.END, f"오류 발생: {e}\n")
@@ -622,7 +1960,16 @@ class YdkPointCalculatorApp:
         self.points_files = []
         self.current_points_file = None
         self.all_deck_files = []
+        self.visible_deck_files = []
+        self.deck_listbox_items = []
+        self.deck_index = DeckSearchIndex()
+        self.pending_search = None
+        self.rule_version = None
         self.current_selected_file = None
+        self.last_scored_deck = None
+        self.last_calculation = None
+        self.pending_result_refresh = None
+        self.cache_warmer = CacheWarmer()
         self.file_watcher = None  
 
         self.main_frame = tk.Frame(root, padx=10, pady=10)
@@ -641,6 +1988,10 @@ class YdkPointCalculatorApp:
         self.refresh_points_btn = tk.Button(self.points_frame, text="새로고침", command=self.refresh_points_files, width=10)
         self.refresh_points_btn.pack(side=tk.RIGHT, padx=(5, 0))
 
+        self.offline_mode = tk.BooleanVar(value=False)
+        self.offline_mode_check = tk.Checkbutton(self.points_frame, text="오프라인", variable=self.offline_mode, command=self.on_offline_mode_changed)
+        self.offline_mode_check.pack(side=tk.RIGHT, padx=(5, 0))
+
         self.folder_frame = tk.Frame(self.main_frame)
         self.folder_frame.pack(fill=tk.X, pady=(0, 5))
         self.select_folder_btn = tk.Button(self.folder_frame, text="덱 폴더 선택", command=self.select_folder)
@@ -648,7 +1999,7 @@ class YdkPointCalculatorApp:
         self.folder_label = tk.Label(self.folder_frame, text="선택된 폴더 없음", wraplength=300, justify=tk.LEFT)
         self.folder_label.pack(side=tk.LEFT, padx=(10, 0))
 
-        self.url_frame = tk.LabelFrame(self.main_frame, text="뉴런 URL 계산", padx=5, pady=5)
+        self.url_frame = tk.LabelFrame(self.main_frame, text="뉴런 URL / 덱 코드 계산", padx=5, pady=5)
         self.url_frame.pack(fill=tk.X, pady=(0, 5))
         
         self.url_entry = tk.Entry(self.url_frame, width=60)
@@ -657,6 +2008,15 @@ class YdkPointCalculatorApp:
         self.url_entry.bind('<FocusIn>', self.on_url_entry_focus_in)
         self.url_entry.bind('<FocusOut>', self.on_url_entry_focus_out)
         
+        self.bulk_url_btn = tk.Button(self.url_frame, text="일괄", command=self.open_bulk_url_window)
+        self.bulk_url_btn.pack(side=tk.RIGHT, padx=(5, 0))
+
+        self.copy_deck_code_btn = tk.Button(self.url_frame, text="덱 코드 복사", command=self.copy_deck_code)
+        self.copy_deck_code_btn.pack(side=tk.RIGHT, padx=(5, 0))
+
+        self.clipboard_btn = tk.Button(self.url_frame, text="클립보드", command=self.calculate_clipboard_score, state=tk.DISABLED)
+        self.clipboard_btn.pack(side=tk.RIGHT, padx=(5, 0))
+
         self.calculate_url_btn = tk.Button(self.url_frame, text="입력", command=self.calculate_url_score, state=tk.DISABLED)
         self.calculate_url_btn.pack(side=tk.RIGHT)
 
@@ -683,6 +2043,19 @@ class YdkPointCalculatorApp:
         self.save_cache_check = tk.Checkbutton(self.options_frame, text="카드 정보 기억", variable=self.save_cache)
         self.save_cache_check.pack(side=tk.LEFT, padx=(10, 0))
 
+        self.budget_frame = tk.LabelFrame(self.main_frame, text="포인트 상한 컷 제안", padx=5, pady=5)
+        self.budget_frame.pack(fill=tk.X, pady=(0, 5))
+
+        self.budget_label = tk.Label(self.budget_frame, text="상한:")
+        self.budget_label.pack(side=tk.LEFT)
+        self.budget_entry = tk.Entry(self.budget_frame, width=8)
+        self.budget_entry.pack(side=tk.LEFT, padx=(0, 10))
+
+        self.locked_cards_label = tk.Label(self.budget_frame, text="고정 카드(쉼표 구분):")
+        self.locked_cards_label.pack(side=tk.LEFT)
+        self.locked_cards_entry = tk.Entry(self.budget_frame)
+        self.locked_cards_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
         self.list_frame = tk.Frame(self.main_frame)
         self.list_frame.pack(fill=tk.X, pady=5)
         self.deck_list_label = tk.Label(self.list_frame, text="YDK 파일 목록:")
@@ -692,16 +2065,26 @@ class YdkPointCalculatorApp:
         self.search_frame.pack(fill=tk.X, pady=(0, 5))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self.filter_deck_list)
+        self.search_var.trace("w", self.on_search_changed)
         self.search_entry = tk.Entry(self.search_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         self.auto_calculate = tk.BooleanVar(value=False)
         self.auto_calculate_check = tk.Checkbutton(self.search_frame, text="덱 수정시 자동 계산", variable=self.auto_calculate)
         self.auto_calculate_check.pack(side=tk.RIGHT, padx=(10, 0))
+
+        self.deck_sort_combo = ttk.Combobox(self.search_frame, state="readonly", values=DECK_SORT_OPTIONS, width=8)
+        self.deck_sort_combo.current(0)
+        self.deck_sort_combo.pack(side=tk.RIGHT, padx=(5, 0))
+        self.deck_sort_combo.bind("<<ComboboxSelected>>", self.filter_deck_list)
+
+        self.fuzzy_search = tk.BooleanVar(value=False)
+        self.fuzzy_search_check = tk.Checkbutton(self.search_frame, text="유사 검색", variable=self.fuzzy_search, command=self.filter_deck_list)
+        self.fuzzy_search_check.pack(side=tk.RIGHT, padx=(5, 0))
         
         self.deck_listbox = tk.Listbox(self.list_frame, height=8)
         self.deck_listbox.pack(fill=tk.X)
+        self.deck_listbox.bind("<<ListboxSelect>>", self.on_deck_selected)
 
         self.calculate_btn = tk.Button(self.main_frame, text="포인트 계산", command=self.calculate_score_gui, state=tk.DISABLED)
         self.calculate_btn.pack(fill=tk.X, pady=5)
@@ -717,6 +2100,7 @@ class YdkPointCalculatorApp:
         self.result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         load_caches()
+        cache_change_listeners.append(self.on_card_cache_changed)
         self.initialize_app()
         
         self.url_entry.config(fg='gray')
@@ -727,7 +2111,9 @@ class YdkPointCalculatorApp:
 
     def load_points_files_background(self):
         try:
-            self.points_files = get_points_files_from_github()
+            self.points_files = [] if self.offline_mode.get() else get_points_files_from_github()
+            if not self.points_files:
+                self.points_files = get_local_points_files()
             if self.points_files:
                 self.root.after(0, self.update_points_combo)
             else:
@@ -760,6 +2146,9 @@ class YdkPointCalculatorApp:
         self.status_label.config(text="포인트 파일 목록 새로고침 중...")
         threading.Thread(target=self.load_points_files_background, daemon=True).start()
 
+    def on_offline_mode_changed(self):
+        self.cache_warmer.configure(self.get_options())
+
     def on_points_file_selected(self, event):
         selected_index = self.points_combo.current()
         if selected_index >= 0 and selected_index < len(self.points_files):
@@ -774,17 +2163,26 @@ class YdkPointCalculatorApp:
             if not self.current_points_file:
                 return
                 
-            success = download_points_file(
-                self.current_points_file['download_url'], 
-                self.current_points_file['filename']
-            )
+            success = os.path.exists(resource_path(self.current_points_file['filename']))
+            if self.current_points_file['download_url'] and not self.offline_mode.get():
+                success = download_points_file(
+                    self.current_points_file['download_url'], 
+                    self.current_points_file['filename']
+                ) or success
             
             if success:
-                clear_caches()
-                self.points = load_points(self, self.current_points_file['filename'])
+                clear_score_cache()
+                # 진행 중인 계산이 이전 테이블을 쓰고 있을 수 있으므로 직접 닫지 않고 참조만 놓는다.
+                # 더 이상 쓰는 곳이 없으면 바로 매핑이 해제되어 Windows 에서도 다시 컴파일한 테이블로 교체할 수 있다
+                self.points = None
+                self.points = load_compiled_points(self, self.current_points_file['filename'])
                 if self.points is not None:
+                    points_path = resource_path(self.current_points_file['filename'])
+                    self.rule_version = f"{self.current_points_file['filename']}:{os.stat(points_path).st_mtime_ns}"
+                    self.root.after(0, self.filter_deck_list)
                     self.root.after(0, lambda: self.calculate_btn.config(state=tk.NORMAL))
                     self.root.after(0, lambda: self.calculate_url_btn.config(state=tk.NORMAL))
+                    self.root.after(0, lambda: self.clipboard_btn.config(state=tk.NORMAL))
                     self.root.after(0, lambda: self.status_label.config(text=f"포인트 파일 로드 완료: {self.current_points_file['filename']}"))
                 else:
                     self.root.after(0, lambda: self.status_label.config(text="오류: 포인트 파일을 불러올 수 없습니다."))
@@ -802,22 +2200,105 @@ class YdkPointCalculatorApp:
             self.update_deck_list()
 
     def update_deck_list(self):
-        self.deck_listbox.delete(0, tk.END)
         try:
-            ydk_files = [f for f in os.listdir(self.deck_folder) if f.endswith(".ydk")]
-            self.all_deck_files = ydk_files
+            entries = [
+                (entry.name, entry.stat().st_mtime) for entry in os.scandir(self.deck_folder)
+                if entry.is_file() and entry.name.endswith(".ydk")
+            ]
+            self.deck_index.rebuild(entries)
+            self.all_deck_files = [name for name, _ in entries]
             self.filter_deck_list()
+            self.cache_warmer.configure(self.get_options())
+            self.cache_warmer.warm_folder(self.deck_folder, self.all_deck_files)
         except Exception as e:
             self.show_error(f"폴더를 읽는 중 오류 발생: {e}")
-    
+
+    def on_deck_file_changed(self, file_path):
+        if os.path.dirname(os.path.abspath(file_path)) != os.path.abspath(self.deck_folder):
+            return
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return
+
+        ydk_file = os.path.basename(file_path)
+        if ydk_file not in self.deck_index.mtimes:
+            self.all_deck_files.append(ydk_file)
+        self.deck_index.add(ydk_file, mtime)
+        self.cache_warmer.warm_folder(self.deck_folder, [ydk_file])
+        self.on_search_changed()
+
+    def on_deck_file_removed(self, file_path):
+        ydk_file = os.path.basename(file_path)
+        if ydk_file in self.deck_index.mtimes:
+            self.deck_index.remove(ydk_file)
+            self.all_deck_files.remove(ydk_file)
+            self.on_search_changed()
+
+    def on_search_changed(self, *args):
+        if self.pending_search is not None:
+            self.root.after_cancel(self.pending_search)
+        self.pending_search = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_deck_list)
+
+    def deck_file_total(self, ydk_file):
+        if not self.rule_version:
+            return None
+        return deck_result_cache.file_total(os.path.join(self.deck_folder, ydk_file), self.rule_version, self.deck_index.mtimes.get(ydk_file))
+
+    def sort_deck_files(self, ydk_files, totals):
+        sort_option = self.deck_sort_combo.get()
+        if sort_option == "수정순":
+            return sorted(ydk_files, key=lambda f: self.deck_index.mtimes.get(f, 0), reverse=True)
+        if sort_option == "포인트순":
+            return sorted(ydk_files, key=lambda f: (totals[f] is None, -(totals[f] or 0), f.lower()))
+        return sorted(ydk_files, key=str.lower)
+
     def filter_deck_list(self, *args):
-        search_text = self.search_var.get().lower()
-        self.deck_listbox.delete(0, tk.END)
-        
-        filtered_files = [f for f in self.all_deck_files if search_text in f.lower()]
-        for ydk_file in filtered_files:
-            self.deck_listbox.insert(tk.END, ydk_file)
-    
+        self.pending_search = None
+        selected_indices = self.deck_listbox.curselection()
+        selected_file = self.visible_deck_files[selected_indices[0]] if selected_indices else None
+
+        matches, fuzzy_matches = self.deck_index.search(self.search_var.get(), self.fuzzy_search.get())
+        totals = {ydk_file: self.deck_file_total(ydk_file) for ydk_file in matches + fuzzy_matches}
+        filtered_files = self.sort_deck_files(matches, totals) + self.sort_deck_files(fuzzy_matches, totals)
+
+        self.visible_deck_files = filtered_files
+        self.update_listbox_items([
+            ydk_file if totals[ydk_file] is None else f"{ydk_file}  [{totals[ydk_file]}]"
+            for ydk_file in filtered_files
+        ])
+
+        self.deck_listbox.selection_clear(0, tk.END)
+        if selected_file in totals:
+            self.deck_listbox.selection_set(filtered_files.index(selected_file))
+
+    def update_listbox_items(self, new_items):
+        # 바뀐 구간만 지우고 다시 넣어 목록이 클 때도 입력이 밀리지 않게 한다
+        old_items = self.deck_listbox_items
+        common_length = min(len(old_items), len(new_items))
+
+        prefix = 0
+        while prefix < common_length and old_items[prefix] == new_items[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < common_length - prefix and old_items[-1 - suffix] == new_items[-1 - suffix]:
+            suffix += 1
+
+        if prefix < len(old_items) - suffix:
+            self.deck_listbox.delete(prefix, len(old_items) - suffix - 1)
+        inserted_items = new_items[prefix:len(new_items) - suffix]
+        if inserted_items:
+            self.deck_listbox.insert(prefix, *inserted_items)
+        self.deck_listbox_items = new_items
+
+    def on_deck_selected(self, event):
+        selected_indices = self.deck_listbox.curselection()
+        if not selected_indices or not self.deck_folder:
+            return
+
+        self.cache_warmer.configure(self.get_options())
+        self.cache_warmer.prioritize_deck(os.path.join(self.deck_folder, self.visible_deck_files[selected_indices[0]]))
+
     def start_file_watcher(self):
         if self.file_watcher:
             self.file_watcher.stop()
@@ -828,20 +2309,62 @@ class YdkPointCalculatorApp:
             self.file_watcher.schedule(event_handler, self.deck_folder, recursive=False)
             self.file_watcher.start()
     
+    def start_calculation(self, target, source, options):
+        self.last_calculation = (target, source, options)
+        threading.Thread(target=self.run_calculation, args=(target, source, options), daemon=True).start()
+
+    def run_calculation(self, target, source, options):
+        self.cache_warmer.begin_interactive()
+        try:
+            target(source, self.points, self.result_text, self, options)
+        finally:
+            self.cache_warmer.end_interactive()
+
+    def on_card_cache_changed(self):
+        self.root.after(0, self.schedule_result_refresh)
+
+    def schedule_result_refresh(self):
+        if self.pending_result_refresh is None:
+            self.pending_result_refresh = self.root.after(RESULT_REFRESH_DELAY_MS, self.refresh_last_result)
+
+    def refresh_last_result(self):
+        self.pending_result_refresh = None
+        if self.last_calculation is None or self.points is None:
+            return
+
+        clear_score_cache()
+        target, source, options = self.last_calculation
+        self.status_label.config(text="카드 정보가 갱신되어 다시 계산합니다...")
+        self.start_calculation(target, source, options)
+
+    def get_options(self):
+        try:
+            point_budget = int(self.budget_entry.get().strip())
+        except ValueError:
+            point_budget = None
+
+        locked_cards = {name.strip() for name in self.locked_cards_entry.get().split(',') if name.strip()}
+
+        return {
+            'show_zero_points': self.show_zero_points.get(),
+            'scrape_yugipedia': self.scrape_yugipedia.get(),
+            'include_side_deck': self.include_side_deck.get(),
+            'aggregate_same_cards': self.aggregate_same_cards.get(),
+            'offline_mode': self.offline_mode.get(),
+            'rule_version': self.rule_version,
+            'point_budget': point_budget,
+            'locked_cards': locked_cards
+        }
+
     def auto_calculate_deck(self):
         if self.points is None or not self.current_selected_file:
             return
             
         full_path = os.path.join(self.deck_folder, self.current_selected_file)
         
-        options = {
-            'show_zero_points': self.show_zero_points.get(),
-            'scrape_yugipedia': self.scrape_yugipedia.get(),
-            'include_side_deck': self.include_side_deck.get(),
-            'aggregate_same_cards': self.aggregate_same_cards.get()
-        }
+        options = self.get_options()
         
-        threading.Thread(target=calculate_deck_score_api, args=(full_path, self.points, self.result_text, self, options), daemon=True).start()
+        self.start_calculation(calculate_deck_score_api, full_path, options)
 
 
     def calculate_score_gui(self):
@@ -854,18 +2377,13 @@ class YdkPointCalculatorApp:
             self.show_error("포인트 파일이 올바르게 로드되지 않았습니다. 프로그램을 재시작해주세요.")
             return
 
-        selected_file = self.deck_listbox.get(selected_indices[0])
+        selected_file = self.visible_deck_files[selected_indices[0]]
         self.current_selected_file = selected_file
         full_path = os.path.join(self.deck_folder, selected_file)
         
-        options = {
-            'show_zero_points': self.show_zero_points.get(),
-            'scrape_yugipedia': self.scrape_yugipedia.get(),
-            'include_side_deck': self.include_side_deck.get(),
-            'aggregate_same_cards': self.aggregate_same_cards.get()
-        }
+        options = self.get_options()
 
-        threading.Thread(target=calculate_deck_score_api, args=(full_path, self.points, self.result_text, self, options), daemon=True).start()
+        self.start_calculation(calculate_deck_score_api, full_path, options)
 
     def on_url_entry_focus_in(self, event):
         if self.url_entry.get() == "덱 제목 아래의 링크를 복사하세요. 뉴런 자체 오류, 누락으로인한 카드 누락에 주의":
@@ -888,18 +2406,80 @@ class YdkPointCalculatorApp:
             self.show_error("포인트 파일이 올바르게 로드되지 않았습니다. 포인트 파일을 먼저 선택해주세요.")
             return
 
+        if url.startswith(YDKE_PREFIX):
+            self.calculate_deck_code(url)
+            return
+
         if not url.startswith('http'):
-            self.show_error("올바른 URL을 입력해주세요.")
+            self.show_error("올바른 URL 또는 ydke:// 덱 코드를 입력해주세요.")
             return
         
-        options = {
-            'show_zero_points': self.show_zero_points.get(),
-            'scrape_yugipedia': self.scrape_yugipedia.get(),
-            'include_side_deck': self.include_side_deck.get(),
-            'aggregate_same_cards': self.aggregate_same_cards.get()
-        }
+        options = self.get_options()
+
+        self.start_calculation(calculate_url_score, url, options)
+
+    def open_bulk_url_window(self):
+        bulk_window = tk.Toplevel(self.root)
+        bulk_window.title("뉴런 URL 일괄 계산")
+        bulk_window.geometry("600x400")
+
+        bulk_label = tk.Label(bulk_window, text="뉴런 덱 URL을 한 줄에 하나씩 붙여넣으세요.")
+        bulk_label.pack(anchor=tk.W, padx=10, pady=(10, 0))
+
+        bulk_text = Text(bulk_window, wrap=tk.NONE)
+        bulk_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        bulk_calculate_btn = tk.Button(bulk_window, text="일괄 계산", command=lambda: self.calculate_bulk_url_score(bulk_window, bulk_text))
+        bulk_calculate_btn.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+    def calculate_bulk_url_score(self, bulk_window, bulk_text):
+        urls = [line.strip() for line in bulk_text.get(1.0, tk.END).splitlines() if line.strip().startswith('http')]
+        if not urls:
+            self.show_error("URL을 입력해주세요.")
+            return
+
+        if self.points is None:
+            self.show_error("포인트 파일이 올바르게 로드되지 않았습니다. 포인트 파일을 먼저 선택해주세요.")
+            return
+
+        bulk_window.destroy()
+        options = self.get_options()
+
+        self.start_calculation(calculate_bulk_url_score, urls, options)
+
+    def calculate_clipboard_score(self):
+        if self.points is None:
+            self.show_error("포인트 파일이 올바르게 로드되지 않았습니다. 포인트 파일을 먼저 선택해주세요.")
+            return
+
+        try:
+            deck_code = self.root.clipboard_get()
+        except tk.TclError:
+            self.show_error("클립보드에 덱 코드가 없습니다.")
+            return
+
+        self.calculate_deck_code(deck_code)
+
+    def calculate_deck_code(self, deck_code):
+        self.current_selected_file = None
+        options = self.get_options()
+
+        self.start_calculation(calculate_deck_code_score, deck_code, options)
 
-        threading.Thread(target=calculate_url_score, args=(url, self.points, self.result_text, self, options), daemon=True).start()
+    def copy_deck_code(self):
+        if not self.last_scored_deck:
+            self.show_error("먼저 ydk 파일 또는 덱 코드로 포인트를 계산해주세요.")
+            return
+
+        try:
+            deck_code = encode_ydke(self.last_scored_deck)
+        except (ValueError, OverflowError) as e:
+            self.show_error(f"덱 코드로 변환할 수 없는 카드 번호가 있습니다: {e}")
+            return
+
+        self.root.clipboard_clear()
+        self.root.clipboard_append(deck_code)
+        self.status_label.config(text="ydke:// 덱 코드를 클립보드에 복사했습니다.")
 
     def show_error(self, message):
         self.result_text.config(state=tk.NORMAL)
@@ -908,6 +2488,10 @@ class YdkPointCalculatorApp:
         self.result_text.config(state=tk.DISABLED)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
     root = tk.Tk()
     app = YdkPointCalculatorApp(root)
     